@@ -1,61 +1,55 @@
 from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class ASTNode:
     """Base class for all AST nodes"""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class Document(ASTNode):
     """Root node representing a complete Clarity document"""
     children: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class Element(ASTNode):
     """HTML element node"""
     name: str
-    attributes: Dict[str, Any] = None
-    children: List[ASTNode] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    children: List[ASTNode] = field(default_factory=list)
     content: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.attributes is None:
-            self.attributes = {}
-        if self.children is None:
-            self.children = []
 
-@dataclass
+@dataclass(slots=True)
 class TextContent(ASTNode):
     """Text content node"""
     value: str
 
-@dataclass
+@dataclass(slots=True)
 class VariableDeclaration(ASTNode):
     """Variable declaration node"""
     name: str
     value: Any
 
-@dataclass
+@dataclass(slots=True)
 class VariableReference(ASTNode):
     """Variable reference node"""
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class ForLoop(ASTNode):
     """For loop node"""
     iterator: str
     iterable: str
     body: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class Conditional(ASTNode):
     """If/else conditional node"""
     condition: str
     if_body: List[ASTNode]
     else_body: Optional[List[ASTNode]] = None
 
-@dataclass
+@dataclass(slots=True)
 class ComponentDefinition(ASTNode):
     """Component definition node"""
     name: str
@@ -63,23 +57,23 @@ class ComponentDefinition(ASTNode):
     default_values: Dict[str, Any]
     body: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class ComponentUse(ASTNode):
     """Component use node"""
     name: str
     arguments: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class StyleBlock(ASTNode):
     """CSS style block node"""
     content: str
 
-@dataclass
+@dataclass(slots=True)
 class ScriptBlock(ASTNode):
     """JavaScript script block node"""
     content: str
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(ASTNode):
     """String literal node"""
     value: str
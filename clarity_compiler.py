@@ -1,32 +1,272 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, ClassVar, List, Dict, Any, Optional, Tuple
 from clarity_lexer import Lexer, Token, TokenType
 from clarity_parser import Parser
-from clarity_ast import *
+from clarity_ast import (
+    ASTNode, Document, Element, TextContent, VariableDeclaration,
+    ForLoop, Conditional, ComponentDefinition, ComponentUse)
+import ast
+import io
+import re
 import sys
 import os
 
+# Matches a $variable reference; substitution is a single C-level pass
+_VAR_RE = re.compile(r'\$[A-Za-z_]\w*')
+
+
+class _CannotSpecialize(Exception):
+    """Raised when a component body cannot be compiled to an emitter."""
+
+
+# Placeholder substituted for the iterator variable when a loop body is
+# rendered once as a reusable template
+_ITER_SENTINEL = '\x00ITER\x00'
+
+# Marks a variable that was unset before a component bound it
+_MISSING = object()
+
+# Opcodes for the lowered document form: static output is fused into raw
+# strings, dynamic nodes fall back to their handlers
+OP_RAW, OP_TEXT, OP_ELEM, OP_INDENT, OP_NODE = range(5)
+
+# One-pass escape table; html.escape would make three sequential
+# str.replace passes over the same string
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+})
+
+
+def escape_html(text: str) -> str:
+    """Escape HTML special characters in a single C-level pass"""
+    return text.translate(_HTML_ESCAPE)
+
+
+# Shared, monotonically growing table of indent strings indexed by depth
+_INDENT_CACHE = ['', '  ']
+
+
+# Expression nodes a condition may contain; anything else (attribute
+# access, comprehensions, lambdas, ...) is rejected before evaluation
+_SAFE_COND_NODES = (
+    ast.Expression, ast.BoolOp, ast.BinOp, ast.UnaryOp, ast.Compare,
+    ast.IfExp, ast.Name, ast.Constant, ast.List, ast.Tuple,
+    ast.boolop, ast.operator, ast.unaryop, ast.cmpop, ast.expr_context,
+)
+_SAFE_COND_FUNCS = {'len': len, 'str': str, 'int': int, 'float': float,
+                    'bool': bool}
+
+
+def _check_condition(tree: ast.Expression) -> None:
+    """Reject conditions containing anything beyond simple expressions"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if not (isinstance(node.func, ast.Name)
+                    and node.func.id in _SAFE_COND_FUNCS):
+                raise ValueError(f"unsafe call in condition")
+        elif not isinstance(node, _SAFE_COND_NODES):
+            raise ValueError(f"unsupported syntax in condition: "
+                             f"{type(node).__name__}")
+
 
 class Compiler:
     def __init__(self, ast: Document):
+        # Caches keyed purely by source text survive reset() so a reused
+        # compiler benefits across documents
+        # Rendered attribute strings keyed by the attribute items
+        self._attr_cache: Dict[Tuple, str] = {}
+        # Compiled condition code objects keyed by their source text
+        self._cond_cache: Dict[str, Any] = {}
+        # Parsed loop iterables keyed by their raw string value
+        self._iterable_cache: Dict[str, List[Any]] = {}
+        self.reset(ast)
+
+    def reset(self, ast: Document) -> None:
+        """Prepare for a fresh document, keeping source-text-keyed caches"""
         self.ast = ast
-        self.output_lines = []
+        self._buf = io.StringIO()
+        self._work: List[Any] = []
         self.indentation = 0
-        self.variables = {}
-        self.components = {}
+        self.variables: Dict[str, Any] = {}
+        self.components: Dict[str, ComponentDefinition] = {}
+        # Memoized output fragments for pure components, keyed by
+        # (name, args, indentation); bounded to avoid unbounded growth
+        self._component_cache: Dict[Tuple, str] = {}
+        self._component_refs: Dict[str, Optional[set]] = {}
+        # $-prefixed parameter-name sets, built once per component
+        self._param_sets: Dict[str, set] = {}
+        # Specialized emitter functions generated per component at first
+        # use (None marks components that cannot be specialized)
+        self._component_fns: Dict[str, Any] = {}
+        # Rendered loop-body templates keyed by (loop id, indentation)
+        self._loop_templates: Dict[Tuple[int, int], str] = {}
+        self._components_scanned = False
+        # Save lists of the component expansions currently in progress;
+        # variable declarations inside a component body record the prior
+        # binding into the innermost one so it is undone on restore
+        self._scope_stack: List[List[Tuple[str, Any]]] = []
+        # Lowered op list, built on first compile() and reusable after
+        self._ops: Optional[List[Tuple]] = None
 
     def compile(self) -> str:
         """Compile AST to HTML"""
-        # First pass: collect all component definitions
-        self._collect_components(self.ast.children)
+        # Lower the document once into a flat op list: static structure
+        # becomes fused raw strings, dynamic nodes keep their handlers.
+        # Components register as execution reaches them; forward
+        # references trigger a one-time scan in _compile_component_use
+        if self._ops is None:
+            self._ops = self._lower(self.ast.children)
+
+        buf = self._buf
+        for op in self._ops:
+            kind = op[0]
+            if kind == OP_RAW:
+                buf.write(op[1])
+            elif kind == OP_TEXT:
+                buf.write(op[1] + self._replace_variables(op[2]) + '\n')
+            elif kind == OP_ELEM:
+                buf.write(op[1] + self._replace_variables(op[2]) + op[3])
+            elif kind == OP_INDENT:
+                self.indentation = op[1]
+            else:  # OP_NODE
+                self._work = [op[1]]
+                self._run()
+
+        return self._buf.getvalue()
+
+    def _lower(self, nodes: List[ASTNode]) -> List[Tuple]:
+        """Flatten the document tree into a linear op list.
+
+        Elements and text whose output is fixed at lowering time are
+        pre-rendered and merged into single OP_RAW strings; text with
+        variable references keeps a substitution op; everything else is
+        executed through its normal handler via OP_NODE, preceded by an
+        OP_INDENT that synchronizes the runtime depth.
+        """
+        ops: List[Tuple] = []
+        pending: List[str] = []
+
+        def indent_str(depth: int) -> str:
+            cache = _INDENT_CACHE
+            while len(cache) <= depth + 1:
+                cache.append(cache[-1] + '  ')
+            return cache[depth]
+
+        def flush() -> None:
+            if pending:
+                ops.append((OP_RAW, ''.join(pending)))
+                del pending[:]
+
+        def lower_nodes(nodes: List[ASTNode], depth: int) -> None:
+            for node in nodes:
+                if isinstance(node, Element):
+                    lower_element(node, depth)
+                elif isinstance(node, TextContent):
+                    if '$' in node.value:
+                        flush()
+                        ops.append((OP_TEXT, indent_str(depth), node.value))
+                    else:
+                        pending.append(indent_str(depth) + node.value + '\n')
+                else:
+                    flush()
+                    ops.append((OP_INDENT, depth * 2))
+                    ops.append((OP_NODE, node))
+
+        def lower_element(element: Element, depth: int) -> None:
+            if element.name == 'document':
+                pending.append('<!DOCTYPE html>\n<html>\n')
+                lower_nodes(element.children, depth)
+                pending.append('</html>\n')
+                return
 
-        # Second pass: compile all nodes
-        for node in self.ast.children:
-            self._compile_node(node)
+            if element.name == 'style' or element.name == 'script':
+                # Rare; emitted through the existing handler
+                flush()
+                ops.append((OP_INDENT, depth * 2))
+                ops.append((OP_NODE, element))
+                return
+
+            tag = element.name
+            attrs = self._compile_attributes(element.attributes)
+            prefix = indent_str(depth)
+            open_tag = f'<{tag} {attrs}' if attrs else f'<{tag}'
+
+            if element.content:
+                if '$' in element.content:
+                    flush()
+                    ops.append((OP_ELEM, prefix + open_tag + '>',
+                                element.content, f'</{tag}>\n'))
+                else:
+                    pending.append(
+                        f'{prefix}{open_tag}>{element.content}</{tag}>\n')
+                return
 
-        return '\n'.join(self.output_lines)
+            pending.append(prefix + open_tag + '>\n')
+            if element.children:
+                lower_nodes(element.children, depth + 1)
+            pending.append(prefix + f'</{tag}>\n')
+
+        lower_nodes(nodes, 0)
+        flush()
+        return ops
+
+    def _run(self) -> None:
+        """Drain the work stack.
+
+        Items are either AST nodes or sentinel tuples pushed by the node
+        handlers: ('raw', text), ('indent', delta), ('setvar', key, value),
+        ('delvar', key), ('restore', saved). Using an explicit stack
+        instead of recursion avoids a Python frame per nested element and
+        lifts the recursion limit on document depth.
+        """
+        work = self._work
+        while work:
+            item = work.pop()
+            if type(item) is tuple:
+                op = item[0]
+                if op == 'raw':
+                    self._buf.write(item[1])
+                elif op == 'indent':
+                    self.indentation += item[1]
+                elif op == 'setvar':
+                    self.variables[item[1]] = item[2]
+                elif op == 'delvar':
+                    self.variables.pop(item[1], None)
+                elif op == 'restore':
+                    self._scope_stack.pop()
+                    self._restore_variables(item[1])
+            else:
+                self._compile_node(item)
+
+    def _restore_variables(self, saved: List[Tuple[str, Any]]) -> None:
+        """Undo variable bindings recorded during a component expansion.
+
+        Entries are replayed newest-first so that when a name was saved
+        more than once (a parameter redeclared in the body, say) the
+        oldest recorded value is the one that sticks.
+        """
+        variables = self.variables
+        for key, value in reversed(saved):
+            if value is _MISSING:
+                variables.pop(key, None)
+            else:
+                variables[key] = value
+
+    def _render_nodes(self, nodes: List[ASTNode]) -> str:
+        """Compile a node list into a standalone fragment string"""
+        outer_buf, outer_work = self._buf, self._work
+        self._buf = io.StringIO()
+        self._work = list(reversed(nodes))
+        try:
+            self._run()
+            return self._buf.getvalue()
+        finally:
+            self._buf, self._work = outer_buf, outer_work
 
     def _collect_components(self, nodes: List[ASTNode]) -> None:
-        """Pre-process to collect all component definitions"""
+        """Scan for component definitions (forward references only)"""
         for node in nodes:
             if isinstance(node, ComponentDefinition):
                 self.components[node.name] = node
@@ -35,36 +275,27 @@ class Compiler:
 
     def _compile_node(self, node: ASTNode) -> None:
         """Compile a node based on its type"""
-        if isinstance(node, Element):
-            self._compile_element(node)
-        elif isinstance(node, TextContent):
-            self._compile_text(node)
-        elif isinstance(node, VariableDeclaration):
-            self._compile_variable_declaration(node)
-        elif isinstance(node, ForLoop):
-            self._compile_for_loop(node)
-        elif isinstance(node, Conditional):
-            self._compile_conditional(node)
-        elif isinstance(node, ComponentDefinition):
-            # Already collected, no need to output anything
-            pass
-        elif isinstance(node, ComponentUse):
-            self._compile_component_use(node)
-        else:
-            # Unknown node type
-            pass
+        # Keep the indent cache one level ahead of the current depth
+        # (special elements indent their content one extra level).
+        cache = _INDENT_CACHE
+        while len(cache) * 2 <= self.indentation + 2:
+            cache.append(cache[-1] + '  ')
+
+        handler = self._DISPATCH.get(type(node))
+        if handler is not None:
+            handler(self, node)
 
     def _compile_element(self, element: Element) -> None:
         """Compile an HTML element"""
         # Special handling for document element
         if element.name == 'document':
-            self.output_lines.append('<!DOCTYPE html>')
-            self.output_lines.append('<html>')
-
-            for child in element.children:
-                self._compile_node(child)
+            self._buf.write('<!DOCTYPE html>\n')
+            self._buf.write('<html>\n')
 
-            self.output_lines.append('</html>')
+            work = self._work
+            work.append(('raw', '</html>\n'))
+            for child in reversed(element.children):
+                work.append(child)
             return
 
         # Special handling for style and script elements
@@ -76,28 +307,33 @@ class Compiler:
         tag = element.name
         attrs = self._compile_attributes(element.attributes)
 
-        # Opening tag
+        # Opening tag, held back until we know whether there is inline content
         if attrs:
-            self.output_lines.append(' ' * self.indentation + f'<{tag} {attrs}>')
+            open_tag = _INDENT_CACHE[self.indentation >> 1] + f'<{tag} {attrs}'
         else:
-            self.output_lines.append(' ' * self.indentation + f'<{tag}>')
+            open_tag = _INDENT_CACHE[self.indentation >> 1] + f'<{tag}'
 
         # Add content if available
         if element.content:
             content = self._replace_variables(element.content)
-            self.output_lines[-1] = self.output_lines[-1][:-1] + f'>{content}</{tag}>'
+            self._buf.write(f'{open_tag}>{content}</{tag}>\n')
             return
 
-        # Add children
-        if element.children:
-            self.indentation += 2
-            for child in element.children:
-                self._compile_node(child)
-            self.indentation -= 2
+        self._buf.write(open_tag)
+        self._buf.write('>\n')
 
-        # Closing tag (if not self-closing)
-        if element.children or not element.content:
-            self.output_lines.append(' ' * self.indentation + f'</{tag}>')
+        close_line = _INDENT_CACHE[self.indentation >> 1] + f'</{tag}>\n'
+
+        # Schedule children (indented one level) and the closing tag
+        if element.children:
+            work = self._work
+            work.append(('raw', close_line))
+            work.append(('indent', -2))
+            for child in reversed(element.children):
+                work.append(child)
+            work.append(('indent', 2))
+        elif not element.content:
+            self._buf.write(close_line)
 
     def _compile_special_element(self, element: Element) -> None:
         """Compile style and script elements with their content"""
@@ -106,64 +342,104 @@ class Compiler:
 
         # Opening tag
         if attrs:
-            self.output_lines.append(' ' * self.indentation + f'<{tag} {attrs}>')
+            self._buf.write(_INDENT_CACHE[self.indentation >> 1] + f'<{tag} {attrs}>\n')
         else:
-            self.output_lines.append(' ' * self.indentation + f'<{tag}>')
+            self._buf.write(_INDENT_CACHE[self.indentation >> 1] + f'<{tag}>\n')
 
-        # Process content
+        # Single pass over the children: take the first triple-quoted
+        # block, whether it arrived as direct text or as element content
         multiline_content = None
 
-        # First, look for direct multiline string content
         for child in element.children:
             if isinstance(child, TextContent):
                 content = child.value
-                if content.strip().startswith('"""') and content.strip().endswith('"""'):
-                    multiline_content = content.strip()[3:-3]
-                    break
-
-        # If not found, look for MULTILINE_STRING token
-        if not multiline_content:
-            for i, child in enumerate(element.children):
-                if isinstance(child, Element) and child.content:
-                    content = child.content
-                    if isinstance(content, str) and '"""' in content:
-                        start_idx = content.find('"""') + 3
-                        end_idx = content.rfind('"""')
-                        if end_idx > start_idx:
-                            multiline_content = content[start_idx:end_idx]
-                            break
-
-        # Output the content
+            elif isinstance(child, Element) and isinstance(child.content, str):
+                content = child.content
+            else:
+                continue
+
+            start_idx = content.find('"""')
+            if start_idx < 0:
+                continue
+            end_idx = content.rfind('"""')
+            if end_idx > start_idx:
+                multiline_content = content[start_idx + 3:end_idx]
+                break
+
+        # Output the content as one prefixed block: a single split and
+        # join instead of a write per line
         if multiline_content:
-            lines = multiline_content.split('\n')
-            for line in lines:
-                self.output_lines.append(' ' * (self.indentation + 2) + line)
+            prefix = _INDENT_CACHE[(self.indentation + 2) >> 1]
+            self._buf.write(prefix +
+                            ('\n' + prefix).join(multiline_content.split('\n')))
+            self._buf.write('\n')
 
         # Closing tag
-        self.output_lines.append(' ' * self.indentation + f'</{tag}>')
+        self._buf.write(_INDENT_CACHE[self.indentation >> 1] + f'</{tag}>\n')
 
     def _compile_attributes(self, attributes: Dict[str, Any]) -> str:
         """Compile element attributes to HTML format"""
-        attr_strs = []
-
-        for key, value in attributes.items():
-            if isinstance(value, bool) and value:
-                # Boolean attribute
-                attr_strs.append(key)
-            else:
-                # Regular attribute with value
-                attr_strs.append(f'{key}="{value}"')
-
-        return ' '.join(attr_strs)
+        if not attributes:
+            return ''
+
+        # The same attribute dict recurs across loop iterations and
+        # component uses; render it once and reuse the interned result
+        cache_key = tuple(attributes.items())
+        rendered = self._attr_cache.get(cache_key)
+        if rendered is not None:
+            return rendered
+
+        # Boolean attributes render as the bare key, the rest as key="value";
+        # feeding the generator straight to join skips the temporary list
+        rendered = sys.intern(' '.join(
+            key if value is True else f'{key}="{escape_html(str(value))}"'
+            for key, value in attributes.items()))
+        self._attr_cache[cache_key] = rendered
+        return rendered
 
     def _compile_text(self, text: TextContent) -> None:
         """Compile text content"""
         content = self._replace_variables(text.value)
-        self.output_lines.append(' ' * self.indentation + content)
+        self._buf.write(_INDENT_CACHE[self.indentation >> 1] + content + '\n')
 
     def _compile_variable_declaration(self, var_decl: VariableDeclaration) -> None:
-        """Process variable declaration (no output, just store for substitution)"""
-        self.variables[f"${var_decl.name}"] = var_decl.value
+        """Process variable declaration (no output, just store for substitution)
+
+        Variables are keyed by bare name; the $ sigil is stripped at the
+        reference sites so lookups need no per-access string building.
+        Inside a component expansion the prior binding is recorded on the
+        innermost save list so the declaration stays scoped to the body.
+        """
+        variables = self.variables
+        if self._scope_stack:
+            self._scope_stack[-1].append(
+                (var_decl.name, variables.get(var_decl.name, _MISSING)))
+        variables[var_decl.name] = var_decl.value
+
+    def _parse_iterable(self, raw_value: str) -> List[Any]:
+        """Parse a list-like string value into its items.
+
+        ast.literal_eval handles quoted strings, numbers and nested lists
+        in one C-backed call; malformed or unquoted lists fall back to
+        the old comma-splitting behaviour.
+        """
+        try:
+            value = ast.literal_eval(raw_value)
+        except (ValueError, SyntaxError):
+            value = None
+
+        if isinstance(value, (list, tuple)):
+            return list(value)
+
+        # Fallback: the original ad-hoc handling
+        if raw_value.startswith('[') and raw_value.endswith(']'):
+            items = [item.strip() for item in raw_value[1:-1].split(',')]
+            if all(item.startswith('"') and item.endswith('"') for item in items):
+                items = [item[1:-1] for item in items]
+            return items
+
+        # Treat as a single item
+        return [raw_value]
 
     def _compile_for_loop(self, loop: ForLoop) -> None:
         """Process a for loop by expanding it"""
@@ -172,18 +448,13 @@ class Compiler:
 
         # Handle variable reference in iterable
         if iterable.startswith('$'):
-            if iterable in self.variables:
-                # Very basic handling - assumes it's a list-like string representation
-                # In a real compiler, you'd have proper evaluation
-                raw_value = self.variables[iterable]
-                if raw_value.startswith('[') and raw_value.endswith(']'):
-                    items = raw_value[1:-1].split(',')
-                    items = [item.strip() for item in items]
-                    if all(item.startswith('"') and item.endswith('"') for item in items):
-                        items = [item[1:-1] for item in items]
-                else:
-                    # Fallback - treat as a single item
-                    items = [raw_value]
+            name = iterable[1:]
+            if name in self.variables:
+                raw_value = self.variables[name]
+                items = self._iterable_cache.get(raw_value)
+                if items is None:
+                    items = self._parse_iterable(raw_value)
+                    self._iterable_cache[raw_value] = items
             else:
                 # Unknown variable, emit warning
                 print(f"Warning: Unknown variable {iterable} in for loop")
@@ -193,88 +464,322 @@ class Compiler:
             print(f"Warning: Direct iterables not implemented in for loop: {iterable}")
             return
 
-        # Process the loop body for each item
-        for item in items:
-            # Store the iterator variable
-            temp_var = f"${loop.iterator}"
-            self.variables[temp_var] = item
-
-            # Process the loop body
-            for node in loop.body:
-                self._compile_node(node)
+        temp_var = loop.iterator
+
+        # Static bodies are rendered once with a sentinel standing in for
+        # the iterator, then replayed with a cheap replace per item
+        # (_static_refs reports source-level $references)
+        refs = self._static_refs(loop.body)
+        if refs is not None:
+            iter_only = refs <= {f"${temp_var}"}
+            key = (id(loop), self.indentation)
+            template = self._loop_templates.get(key) if iter_only else None
+            if template is None:
+                self.variables[temp_var] = _ITER_SENTINEL
+                template = self._render_nodes(loop.body)
+                self.variables.pop(temp_var, None)
+                if iter_only:
+                    self._loop_templates[key] = template
+            write = self._buf.write
+            for item in items:
+                write(template.replace(_ITER_SENTINEL, str(item)))
+            return
 
-            # Clean up
-            if temp_var in self.variables:
-                del self.variables[temp_var]
+        # Schedule the loop body for each item, binding the iterator
+        # variable before the body and dropping it afterwards
+        work = self._work
+        for item in reversed(items):
+            work.append(('delvar', temp_var))
+            for node in reversed(loop.body):
+                work.append(node)
+            work.append(('setvar', temp_var, item))
 
     def _compile_conditional(self, cond: Conditional) -> None:
         """Process a conditional statement"""
-        # This is a very simplistic implementation
-        condition = cond.condition
-
-        # Replace variables in the condition
-        for var_name, var_value in self.variables.items():
-            condition = condition.replace(var_name, f'"{var_value}"')
-
-        # Evaluate the condition (using eval - never do this in production!)
-        # In a real compiler, you'd have proper safe evaluation
-        try:
-            result = eval(condition)
-        except Exception as e:
-            print(f"Warning: Failed to evaluate condition {condition}: {e}")
+        # Compile the condition once: rewrite $var references to plain
+        # names, validate against the expression whitelist, and cache the
+        # code object so repeated evaluations skip parsing entirely.
+        code: Any = self._cond_cache.get(cond.condition)
+        if code is None:
+            rewritten = _VAR_RE.sub(lambda m: m.group(0)[1:], cond.condition)
+            try:
+                tree = ast.parse(rewritten, mode='eval')
+                _check_condition(tree)
+                code = compile(tree, '<cond>', 'eval')
+            except (SyntaxError, ValueError) as e:
+                print(f"Warning: Failed to compile condition "
+                      f"{cond.condition}: {e}")
+                code = False
+            self._cond_cache[cond.condition] = code
+
+        if code is False:
             result = False
+        else:
+            # Variables are stored under bare names, so the scope can be
+            # used as the eval locals directly
+            try:
+                result = eval(code, {'__builtins__': {}, **_SAFE_COND_FUNCS},
+                              self.variables)
+            except Exception as e:
+                print(f"Warning: Failed to evaluate condition "
+                      f"{cond.condition}: {e}")
+                result = False
 
         if result:
-            # Process the if body
-            for node in cond.if_body:
-                self._compile_node(node)
+            # Schedule the if body
+            self._work.extend(reversed(cond.if_body))
         elif cond.else_body:
-            # Process the else body
-            for node in cond.else_body:
-                self._compile_node(node)
+            # Schedule the else body
+            self._work.extend(reversed(cond.else_body))
 
     def _compile_component_definition(self, comp_def: ComponentDefinition) -> None:
         """Store component definition for later use"""
         self.components[comp_def.name] = comp_def
 
+    def _static_refs(self, nodes: List[ASTNode]) -> Optional[set]:
+        """Collect the $references in a static node list.
+
+        Returns None when the list contains dynamic nodes (loops,
+        conditionals, variable declarations, nested components) whose
+        output may depend on state beyond variable substitution.
+        """
+        refs = set()
+
+        def walk(nodes):
+            for node in nodes:
+                if isinstance(node, Element):
+                    if node.content:
+                        refs.update(_VAR_RE.findall(node.content))
+                    for value in node.attributes.values():
+                        if isinstance(value, str):
+                            refs.update(_VAR_RE.findall(value))
+                    if not walk(node.children):
+                        return False
+                elif isinstance(node, TextContent):
+                    refs.update(_VAR_RE.findall(node.value))
+                else:
+                    # Dynamic node - output may depend on outer state
+                    return False
+            return True
+
+        return refs if walk(nodes) else None
+
+    def _component_var_refs(self, component: ComponentDefinition) -> Optional[set]:
+        """Collect the $references in a component body, or None if the body
+        contains dynamic nodes (loops, conditionals, nested components)"""
+        if component.name in self._component_refs:
+            return self._component_refs[component.name]
+
+        result = self._static_refs(component.body)
+        self._component_refs[component.name] = result
+        return result
+
+    def _param_set(self, component: ComponentDefinition) -> set:
+        """The component's parameter names in $reference form, memoized"""
+        params = self._param_sets.get(component.name)
+        if params is None:
+            params = {f"${p}" for p in component.parameters}
+            params.update(f"${p}" for p in component.default_values)
+            self._param_sets[component.name] = params
+        return params
+
+    def _codegen_component(self, component: ComponentDefinition) -> Optional[Any]:
+        """Partially evaluate a pure component body into a Python emitter.
+
+        The generated function writes the component's HTML directly,
+        substituting only the parameter references, so repeated uses cost
+        one function call instead of a full AST walk. Returns None when
+        the body cannot be specialized (dynamic nodes, special elements,
+        or references outside the parameter list).
+        """
+        refs = self._component_var_refs(component)
+        if refs is None or not refs <= self._param_set(component):
+            return None
+
+        src = []
+        max_depth = 0
+
+        def content_expr(text: str) -> str:
+            # Split text into literal pieces and parameter substitutions
+            exprs = []
+            last = 0
+            for m in _VAR_RE.finditer(text):
+                if m.start() > last:
+                    exprs.append(repr(text[last:m.start()]))
+                ref = m.group(0)
+                exprs.append(f'str(args.get({ref!r}, {ref!r}))')
+                last = m.end()
+            if last < len(text):
+                exprs.append(repr(text[last:]))
+            return ' + '.join(exprs) if exprs else "''"
+
+        def walk(nodes: List[ASTNode], depth: int) -> None:
+            nonlocal max_depth
+            max_depth = max(max_depth, depth)
+            for node in nodes:
+                if isinstance(node, TextContent):
+                    src.append(f'    write(i{depth} + {content_expr(node.value)}'
+                               f" + '\\n')")
+                    continue
+                # _component_var_refs guarantees Element/TextContent only
+                if not isinstance(node, Element):
+                    raise _CannotSpecialize
+                if node.name in ('document', 'style', 'script'):
+                    raise _CannotSpecialize
+                attrs = self._compile_attributes(node.attributes)
+                open_tag = f'<{node.name} {attrs}' if attrs else f'<{node.name}'
+                if node.content:
+                    line = (f'{open_tag + ">"!r} + {content_expr(node.content)}'
+                            f' + {"</" + node.name + ">"!r}')
+                    src.append(f"    write(i{depth} + {line} + '\\n')")
+                    continue
+                src.append(f'    write(i{depth} + {open_tag + ">"!r} + \'\\n\')')
+                if node.children:
+                    walk(node.children, depth + 1)
+                src.append(f'    write(i{depth} + {"</" + node.name + ">"!r}'
+                           f" + '\\n')")
+
+        try:
+            walk(component.body, 0)
+        except _CannotSpecialize:
+            return None
+
+        header = ['def _emit(write, indent, args):', '    i0 = indent']
+        for d in range(1, max_depth + 1):
+            header.append(f"    i{d} = i{d - 1} + '  '")
+        fn_src = '\n'.join(header + (src or ['    pass']))
+
+        namespace: Dict[str, Any] = {}
+        exec(compile(fn_src, f'<component:{component.name}>', 'exec'), namespace)
+        return namespace['_emit']
+
     def _compile_component_use(self, comp_use: ComponentUse) -> None:
         """Process component use by expanding the component with arguments"""
         component_name = comp_use.name
 
         if component_name not in self.components:
-            print(f"Warning: Unknown component: {component_name}")
-            return
+            # Forward reference: fall back to one full scan for
+            # definitions appearing later in the document
+            if not self._components_scanned:
+                self._collect_components(self.ast.children)
+                self._components_scanned = True
+            if component_name not in self.components:
+                print(f"Warning: Unknown component: {component_name}")
+                return
 
         component = self.components[component_name]
 
-        # Set up component parameters as variables
-        old_vars = self.variables.copy()
-
-        # First apply default values
-        for param, default in component.default_values.items():
-            self.variables[f"${param}"] = default
-
-        # Then apply provided arguments
-        for param, value in comp_use.arguments.items():
-            self.variables[f"${param}"] = value
+        # Effective arguments: defaults overridden by provided values
+        effective_args = dict(component.default_values)
+        effective_args.update(comp_use.arguments)
+
+        # Pure components (static body referencing only their own
+        # parameters) can be expanded once per argument set and replayed
+        cache_key = None
+        refs = self._component_var_refs(component)
+        if refs is not None and refs <= self._param_set(component):
+            cache_key = (component_name, tuple(sorted(effective_args.items())),
+                         self.indentation)
+            cached = self._component_cache.get(cache_key)
+            if cached is not None:
+                self._buf.write(cached)
+                return
 
-        # Process the component body
-        for node in component.body:
-            self._compile_node(node)
+            # Specialized emitter: one function call instead of a body walk.
+            # Only valid when every reference resolves to an argument,
+            # which is exactly the cacheable case.
+            fn = self._component_fns.get(component_name, False)
+            if fn is False:
+                fn = self._codegen_component(component)
+                self._component_fns[component_name] = fn
+            if fn is not None:
+                tmp = io.StringIO()
+                fn(tmp.write, _INDENT_CACHE[self.indentation >> 1],
+                   {f"${p}": v for p, v in effective_args.items()})
+                fragment = tmp.getvalue()
+                if len(self._component_cache) < 1024:
+                    self._component_cache[cache_key] = fragment
+                self._buf.write(fragment)
+                return
 
-        # Restore original variables
-        self.variables = old_vars
+        # Bind component parameters, recording only the entries that are
+        # overwritten instead of copying the whole scope
+        variables = self.variables
+        saved = [(param, variables.get(param, _MISSING))
+                 for param in effective_args]
+        for param, value in effective_args.items():
+            variables[param] = value
+
+        # Process the component body; the save list stays open on the
+        # scope stack so declarations in the body are recorded onto it
+        self._scope_stack.append(saved)
+        if cache_key is None:
+            work = self._work
+            work.append(('restore', saved))
+            for node in reversed(component.body):
+                work.append(node)
+        else:
+            fragment = self._render_nodes(component.body)
+            self._scope_stack.pop()
+            self._restore_variables(saved)
+            if len(self._component_cache) < 1024:
+                self._component_cache[cache_key] = fragment
+            self._buf.write(fragment)
 
     def _replace_variables(self, text: str) -> str:
         """Replace variable references in text"""
         if not isinstance(text, str):
             return text
 
-        for var_name, var_value in self.variables.items():
-            if var_name in text:
-                text = text.replace(var_name, str(var_value))
+        variables = self.variables
+        return _VAR_RE.sub(
+            lambda m: str(variables.get(m.group(0)[1:], m.group(0))), text)
+
+    # O(1) node dispatch by concrete type instead of an isinstance chain,
+    # built once at class level rather than per instance; ComponentDefinition
+    # registers itself and produces no output
+    _DISPATCH: ClassVar[Dict[type, Callable[['Compiler', Any], None]]] = {
+        Element: _compile_element,
+        TextContent: _compile_text,
+        VariableDeclaration: _compile_variable_declaration,
+        ForLoop: _compile_for_loop,
+        Conditional: _compile_conditional,
+        ComponentUse: _compile_component_use,
+        ComponentDefinition: _compile_component_definition,
+    }
+
+
+def compile_many(input_files: List[str]) -> None:
+    """Compile a batch of Clarity files, reusing one Compiler.
+
+    The compiler's source-text-keyed caches (attribute strings, compiled
+    conditions, parsed iterables) carry over between files, which pays
+    off when many files share a component library or stylesheet idioms.
+    """
+    compiler = None
+    for input_file in input_files:
+        try:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                source_code = f.read()
+
+            tokens = Lexer(source_code).tokenize()
+            ast = Parser(tokens).parse()
 
-        return text
+            if compiler is None:
+                compiler = Compiler(ast)
+            else:
+                compiler.reset(ast)
+            html_output = compiler.compile()
+
+            output_file = os.path.splitext(input_file)[0] + '.html'
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(html_output)
+            print(f"Compiled {input_file} to {output_file}")
+
+        except FileNotFoundError:
+            print(f"Error: File {input_file} not found.")
+        except Exception as e:
+            print(f"Error: {e}")
 
 
 def compile_clarity_file(input_file: str, output_file: Optional[str] = None) -> None:
@@ -1,9 +1,96 @@
 import re
-from enum import Enum, auto
+from array import array
+from bisect import bisect_left
+from enum import Enum, IntEnum, auto
 from typing import List, Tuple, Optional
 
+# One compiled maximal-munch pattern classifies (and for statement-level
+# tokens, consumes) the token starting at the current position. sre runs
+# the alternation in C, replacing the old chain of per-call slice
+# comparisons. Order matters: longer/more specific alternatives first.
+_MASTER_RE = re.compile(
+    br'(?P<MLSTR>""")'
+    br'|(?P<STR>["\'])'
+    br'|(?P<COMMENT>#[^\n]*)'
+    br'|(?P<VARDECL>\$\w*\s*=[^\n#]*)'
+    br'|(?P<VARREF>\$\w*)'
+    br'|(?P<COMPDEF>@component[^:\n]*:?)'
+    br'|(?P<COMPUSE>@[^:\n]*:?)'
+    br'|(?P<FOR>for [^:\n]*)'
+    br'|(?P<IF>if [^:\n]*)'
+    br'|(?P<ELSE>else(?: *:| [^:\n]*:?|(?=\n)))'
+    br'|(?P<IDENT>[A-Za-z_\x80-\xff][\w\x80-\xff-]*)'
+    br'|(?P<NL>\n)'
+    br'|(?P<COLON>:)'
+)
+
+# Character-class scanners for the remaining per-character loops. A
+# compiled pattern's match() runs the whole scan inside sre's C loop,
+# so the interpreter is entered once per run instead of once per byte.
+# Bytes >= 0x80 (UTF-8 lead and continuation bytes) count as identifier
+# characters: they never collide with an ASCII delimiter, and treating
+# them as word bytes keeps non-ASCII content like "café" in one token.
+_IDENT_CHARS_RE = re.compile(br'[\w\x80-\xff-]*')
+_LINE_SPACE_RE = re.compile(br'[^\S\n]*')
+
+
+def _scan_ident_py(source: bytes, pos: int) -> int:
+    """Return the position just past an identifier run starting at pos."""
+    match = _IDENT_CHARS_RE.match(source, pos)
+    assert match is not None  # a starred class matches the empty string
+    return match.end()
+
+
+def _scan_line_space_py(source: bytes, pos: int) -> int:
+    """Return the position just past any non-newline whitespace at pos."""
+    match = _LINE_SPACE_RE.match(source, pos)
+    assert match is not None
+    return match.end()
+
+
+# Prefer the Cython scanners when the optional extension is built; the
+# regex-backed definitions above remain the pure-Python fallback
+try:
+    from clarity_lexer_c import (  # type: ignore[import-not-found]
+        scan_ident as _scan_ident, scan_line_space as _scan_line_space)
+except ImportError:
+    _scan_ident = _scan_ident_py
+    _scan_line_space = _scan_line_space_py
+
+
+# Byte values tested in the hot paths (indexing bytes yields ints)
+_NEWLINE = 0x0A    # \n
+_HASH = 0x23       # #
+_COLON = 0x3A      # :
+_BACKSLASH = 0x5C  # \
+
+# 256-entry classification table, built once at import. Loops that test
+# a byte against several alternatives do one table index and bit test
+# instead of a chain of compares. Identifier and whitespace runs are
+# already consumed wholesale by the compiled class patterns above, so
+# only the multi-way tests need entries here.
+_SKIP_LINE = 1   # '\n' or '#' right after indentation means nothing to emit
+_FAST_IDENT = 2  # identifier start that cannot open a keyword
+_CLASS = bytearray(256)
+_CLASS[_NEWLINE] |= _SKIP_LINE
+_CLASS[_HASH] |= _SKIP_LINE
+# Every ASCII letter or underscore starts an element/content token,
+# except 'f'/'i'/'e' which may open for/if/else and must go through the
+# master pattern to disambiguate
+for _b in b'abcdghjklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_':
+    _CLASS[_b] |= _FAST_IDENT
+# Non-ASCII bytes cannot open a keyword either; they start (or continue)
+# content words such as "café"
+for _b in range(0x80, 0x100):
+    _CLASS[_b] |= _FAST_IDENT
+del _b
+
+
+class TokenType(IntEnum):
+    # IntEnum members stringify as bare ints; keep the Enum-style
+    # "TokenType.X" form in error messages
+    __str__ = Enum.__str__
 
-class TokenType(Enum):
     ELEMENT = auto()
     ATTRIBUTE = auto()
     CONTENT = auto()
@@ -24,7 +111,22 @@ class TokenType(Enum):
     MULTILINE_STRING = auto()  # Added for triple-quoted strings
 
 
+# Master-pattern groups that map one-to-one onto token types
+_GROUP_TOKENS = {
+    'COMMENT': TokenType.COMMENT,
+    'VARDECL': TokenType.VARIABLE_DECL,
+    'VARREF': TokenType.VARIABLE_REF,
+    'COMPDEF': TokenType.COMPONENT_DEF,
+    'COMPUSE': TokenType.COMPONENT_USE,
+    'FOR': TokenType.FOR_LOOP,
+    'IF': TokenType.IF_STATEMENT,
+    'ELSE': TokenType.ELSE_STATEMENT,
+}
+
+
 class Token:
+    __slots__ = ('type', 'value', 'line', 'column')
+
     def __init__(self, token_type: TokenType, value: str, line: int, column: int):
         self.type = token_type
         self.value = value
@@ -35,96 +137,155 @@ class Token:
         return f"Token({self.type}, '{self.value}', line={self.line}, col={self.column})"
 
 
+class TokenStream:
+    """Token storage as three parallel arrays (structure-of-arrays).
+
+    Storing one object per token costs an allocation plus four boxed
+    attributes each; keeping types, values and source offsets in
+    parallel arrays lets the parser check a token's type with a single
+    list index and int compare. Line and column numbers are only
+    consulted for diagnostics, so tokens carry their byte offset and
+    positions are recovered on demand by bisecting the newline index.
+    """
+    __slots__ = ('types', 'values', 'offsets', '_newlines')
+
+    def __init__(self, newlines: array):
+        self.types: List[int] = []
+        self.values: List[str] = []
+        self.offsets = array('i')
+        self._newlines = newlines
+
+    def append(self, token_type: TokenType, value: str, offset: int) -> None:
+        self.types.append(int(token_type))
+        self.values.append(value)
+        self.offsets.append(offset)
+
+    def line_col(self, index: int) -> Tuple[int, int]:
+        """Recover the 1-based line and column of a token from its offset."""
+        offset = self.offsets[index]
+        line = bisect_left(self._newlines, offset) + 1
+        column = offset - self._newlines[line - 2] if line > 1 else offset + 1
+        return line, column
+
+    def token(self, index: int) -> Token:
+        """Materialize a Token object, for diagnostics only."""
+        line, column = self.line_col(index)
+        return Token(TokenType(self.types[index]), self.values[index], line, column)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+
 class Lexer:
     def __init__(self, source_code: str):
-        self.source = source_code
-        self.tokens: List[Token] = []
+        # Lex over bytes: indexing bytes yields plain ints, so the hot
+        # character tests below are int compares that allocate no 1-char
+        # string objects. Token values are decoded back to str per token.
+        self.source = source_code.encode('utf-8')
+        # Index every newline up front; line/column bookkeeping then
+        # disappears from the scanners and positions are recovered by
+        # bisecting this array only when a diagnostic needs them
+        self._newlines = array('i')
+        idx = self.source.find(b'\n')
+        while idx >= 0:
+            self._newlines.append(idx)
+            idx = self.source.find(b'\n', idx + 1)
+        self.tokens = TokenStream(self._newlines)
         self.position = 0
-        self.line = 1
-        self.column = 1
         self.indent_stack = [0]  # Start with no indentation
 
-    def tokenize(self) -> List[Token]:
-        while self.position < len(self.source):
+    def tokenize(self) -> TokenStream:
+        # self.position is threaded through the scanners, but the source
+        # and token stream never change; keep them in locals
+        source = self.source
+        n = len(source)
+        tokens = self.tokens
+
+        while self.position < n:
             # Skip whitespace at the beginning of lines
-            if self.position == 0 or self.source[self.position - 1] == '\n':
+            if self.position == 0 or source[self.position - 1] == _NEWLINE:
                 self._handle_indentation()
 
-            # Process current character
-            if self.position >= len(self.source):
+            if self.position >= n:
                 break
 
-            char = self.source[self.position]
+            # Route on the first byte where it already decides the token
+            # kind; only ambiguous bytes pay for the full alternation
+            byte = source[self.position]
+            if _CLASS[byte] & _FAST_IDENT:
+                self._tokenize_element_or_attribute()
+                continue
+            if byte == _NEWLINE:
+                tokens.append(TokenType.NEWLINE, '\n', self.position)
+                self.position += 1
+                continue
+            if byte == _COLON:
+                tokens.append(TokenType.COLON, ':', self.position)
+                self.position += 1
+                continue
+
+            match = _MASTER_RE.match(source, self.position)
+            if match is None:
+                # Skip other characters
+                self._advance()
+                continue
 
-            # Check for triple quotes (multiline string)
-            if self.position + 2 < len(self.source) and self.source[self.position:self.position + 3] == '"""':
+            group = match.lastgroup
+            if group == 'MLSTR':
                 self._tokenize_multiline_string()
-            elif char == '#':
-                self._tokenize_comment()
-            elif char == '"' or char == "'":
+            elif group == 'STR':
                 self._tokenize_string()
-            elif char == '$':
-                if self._is_variable_declaration():
-                    self._tokenize_variable_declaration()
-                else:
-                    self._tokenize_variable_reference()
-            elif char == ':':
-                self.tokens.append(Token(TokenType.COLON, ':', self.line, self.column))
-                self._advance()
-            elif char == '@':
-                if self._is_component_definition():
-                    self._tokenize_component_definition()
-                else:
-                    self._tokenize_component_use()
-            elif char == '\n':
-                self.tokens.append(Token(TokenType.NEWLINE, '\n', self.line, self.column))
-                self._advance()
-                self.line += 1
-                self.column = 1
-            elif self._is_for_loop():
-                self._tokenize_for_loop()
-            elif self._is_if_statement():
-                self._tokenize_if_statement()
-            elif self._is_else_statement():
-                self._tokenize_else_statement()
-            elif char.isalpha() or char == '_':
+            elif group == 'IDENT':
                 self._tokenize_element_or_attribute()
+            elif group == 'NL':
+                self.tokens.append(TokenType.NEWLINE, '\n', self.position)
+                self.position += 1
+            elif group == 'COLON':
+                self.tokens.append(TokenType.COLON, ':', self.position)
+                self.position += 1
+            elif group is not None:
+                # Statement-level tokens are consumed entirely by the match
+                value = match.group().decode('utf-8')
+                if group != 'COMMENT':
+                    value = value.strip()
+                tokens.append(_GROUP_TOKENS[group], value, match.start())
+                self.position = match.end()
             else:
-                # Skip other characters
+                # Unreachable: every alternative is named
                 self._advance()
 
         # Add any remaining DEDENT tokens
         while self.indent_stack[-1] > 0:
             self.indent_stack.pop()
-            self.tokens.append(Token(TokenType.DEDENT, '', self.line, self.column))
+            tokens.append(TokenType.DEDENT, '', self.position)
 
         # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, '', self.line, self.column))
+        tokens.append(TokenType.EOF, '', self.position)
 
-        return self.tokens
+        return tokens
 
     def _advance(self, count: int = 1) -> None:
         self.position += count
-        self.column += count
 
-    def _peek(self, offset: int = 0) -> Optional[str]:
+    def _line_of(self, offset: int) -> int:
+        """1-based line number of a byte offset, for diagnostics."""
+        return bisect_left(self._newlines, offset) + 1
+
+    def _peek(self, offset: int = 0) -> Optional[int]:
         if self.position + offset >= len(self.source):
             return None
         return self.source[self.position + offset]
 
     def _handle_indentation(self) -> None:
         # Count spaces at the beginning of the line
-        indent = 0
+        source = self.source
         start_pos = self.position
-
-        while self.position < len(self.source) and self.source[self.position].isspace() and self.source[
-            self.position] != '\n':
-            indent += 1
-            self._advance()
+        end = _scan_line_space(source, start_pos)
+        indent = end - start_pos
+        self.position = end
 
         # Skip empty lines or comment lines
-        if self.position < len(self.source) and (
-                self.source[self.position] == '\n' or self.source[self.position] == '#'):
+        if end < len(source) and _CLASS[source[end]] & _SKIP_LINE:
             return
 
         # Compare with current indentation level
@@ -133,266 +294,93 @@ class Lexer:
         if indent > current_indent:
             # Increased indentation
             self.indent_stack.append(indent)
-            self.tokens.append(Token(TokenType.INDENT, ' ' * indent, self.line, start_pos + 1))
+            self.tokens.append(TokenType.INDENT, ' ' * indent, start_pos)
         elif indent < current_indent:
             # Decreased indentation
             while indent < self.indent_stack[-1]:
                 self.indent_stack.pop()
-                self.tokens.append(Token(TokenType.DEDENT, '', self.line, start_pos + 1))
+                self.tokens.append(TokenType.DEDENT, '', start_pos)
 
             if indent != self.indent_stack[-1]:
-                raise SyntaxError(f"Inconsistent indentation at line {self.line}")
-
-    def _tokenize_comment(self) -> None:
-        # Single line comment
-        start_pos = self.position
-
-        while self.position < len(self.source) and self.source[self.position] != '\n':
-            self._advance()
-
-        comment = self.source[start_pos:self.position]
-        self.tokens.append(Token(TokenType.COMMENT, comment, self.line, start_pos + 1))
+                raise SyntaxError(f"Inconsistent indentation at line {self._line_of(start_pos)}")
 
     def _tokenize_multiline_string(self) -> None:
-        # Handle triple-quoted strings like """content"""
+        # Handle triple-quoted strings like """content""": one find to
+        # the closing quotes instead of a per-character walk
         start_pos = self.position
-        start_line = self.line
-        self._advance(3)  # Skip opening triple quotes
-
-        # Find the closing triple quotes
-        closing_found = False
-        while self.position < len(self.source) - 2:
-            if self.source[self.position:self.position + 3] == '"""':
-                closing_found = True
-                break
-
-            if self.source[self.position] == '\n':
-                self.line += 1
-                self.column = 1
-
-            self._advance()
+        source = self.source
 
-        if not closing_found:
-            raise SyntaxError(f"Unterminated multi-line string starting at line {start_line}")
+        idx = source.find(b'"""', start_pos + 3)
+        if idx < 0:
+            raise SyntaxError(
+                f"Unterminated multi-line string starting at line {self._line_of(start_pos)}")
 
         # Include the closing triple quotes
-        string_value = self.source[start_pos:self.position + 3]
-        self.tokens.append(Token(TokenType.MULTILINE_STRING, string_value, start_line, start_pos + 1))
-        self._advance(3)  # Skip closing triple quotes
+        string_value = source[start_pos:idx + 3].decode('utf-8')
+        self.tokens.append(TokenType.MULTILINE_STRING, string_value, start_pos)
+        self.position = idx + 3
 
     def _tokenize_string(self) -> None:
         start_pos = self.position
         quote_char = self.source[self.position]
-        self._advance()  # Skip opening quote
-
-        # Find the closing quote
-        closing_found = False
-        while self.position < len(self.source):
-            if self.source[self.position] == quote_char and (
-                    self.position == 0 or self.source[self.position - 1] != '\\'):
-                closing_found = True
-                break
-
-            if self.source[self.position] == '\n':
-                self.line += 1
-                self.column = 1
-
-            self._advance()
-
-        if not closing_found:
-            raise SyntaxError(f"Unterminated string at line {self.line}")
-
-        string_value = self.source[start_pos:self.position + 1]
-        self.tokens.append(Token(TokenType.STRING, string_value, self.line, start_pos + 1))
-        self._advance()  # Skip closing quote
-
-    def _is_variable_declaration(self) -> bool:
-        # Check if this is a variable declaration like $var = value
-        i = self.position + 1
-        while i < len(self.source) and (self.source[i].isalnum() or self.source[i] == '_'):
-            i += 1
-
-        while i < len(self.source) and self.source[i].isspace():
-            i += 1
-
-        return i < len(self.source) and self.source[i] == '='
-
-    def _tokenize_variable_declaration(self) -> None:
-        start_pos = self.position
-        self._advance()  # Skip $
-
-        # Get variable name
-        while self.position < len(self.source) and (
-                self.source[self.position].isalnum() or self.source[self.position] == '_'):
-            self._advance()
-
-        # Skip whitespace
-        while self.position < len(self.source) and self.source[self.position].isspace():
-            self._advance()
-
-        # Skip =
-        if self.position < len(self.source) and self.source[self.position] == '=':
-            self._advance()
-        else:
-            raise SyntaxError(f"Expected = in variable declaration at line {self.line}")
-
-        # Skip whitespace
-        while self.position < len(self.source) and self.source[self.position].isspace():
-            self._advance()
-
-        # Get value until end of line or comment
-        value_start = self.position
-        while self.position < len(self.source) and self.source[self.position] != '\n' and self.source[
-            self.position] != '#':
-            self._advance()
-
-        decl = self.source[start_pos:self.position].strip()
-        self.tokens.append(Token(TokenType.VARIABLE_DECL, decl, self.line, start_pos + 1))
-
-    def _tokenize_variable_reference(self) -> None:
-        start_pos = self.position
-        self._advance()  # Skip $
-
-        # Get variable name
-        while self.position < len(self.source) and (
-                self.source[self.position].isalnum() or self.source[self.position] == '_'):
-            self._advance()
-
-        var_ref = self.source[start_pos:self.position]
-        self.tokens.append(Token(TokenType.VARIABLE_REF, var_ref, self.line, start_pos + 1))
-
-    def _is_for_loop(self) -> bool:
-        if self.position + 3 < len(self.source):
-            return self.source[self.position:self.position + 4] == 'for ' and self._check_keyword_boundary(4)
-        return False
-
-    def _tokenize_for_loop(self) -> None:
-        start_pos = self.position
-
-        # Find the end of the for loop statement
-        while self.position < len(self.source) and self.source[self.position] != ':' and self.source[
-            self.position] != '\n':
-            self._advance()
-
-        for_loop = self.source[start_pos:self.position].strip()
-        self.tokens.append(Token(TokenType.FOR_LOOP, for_loop, self.line, start_pos + 1))
-
-    def _is_if_statement(self) -> bool:
-        if self.position + 2 < len(self.source):
-            return self.source[self.position:self.position + 3] == 'if ' and self._check_keyword_boundary(2)
-        return False
-
-    def _tokenize_if_statement(self) -> None:
-        start_pos = self.position
-
-        # Find the end of the if statement
-        while self.position < len(self.source) and self.source[self.position] != ':' and self.source[
-            self.position] != '\n':
-            self._advance()
-
-        if_stmt = self.source[start_pos:self.position].strip()
-        self.tokens.append(Token(TokenType.IF_STATEMENT, if_stmt, self.line, start_pos + 1))
-
-    def _is_else_statement(self) -> bool:
-        if self.position + 4 < len(self.source):
-            return self.source[self.position:self.position + 5] == 'else:' or (
-                    self.source[self.position:self.position + 4] == 'else' and
-                    self.source[self.position + 4].isspace()
-            )
-        return False
-
-    def _tokenize_else_statement(self) -> None:
-        start_pos = self.position
-
-        # Find the end of the else statement
-        while self.position < len(self.source) and self.source[self.position] != ':' and self.source[
-            self.position] != '\n':
-            self._advance()
-
-        if self.position < len(self.source) and self.source[self.position] == ':':
-            self._advance()  # Include the colon
-
-        else_stmt = self.source[start_pos:self.position].strip()
-        self.tokens.append(Token(TokenType.ELSE_STATEMENT, else_stmt, self.line, start_pos + 1))
-
-    def _is_component_definition(self) -> bool:
-        # @component Name(params):
-        if self.position + 9 < len(self.source):
-            return self.source[self.position:self.position + 10] == '@component'
-        return False
-
-    def _tokenize_component_definition(self) -> None:
-        start_pos = self.position
-
-        # Find the end of the component definition
-        while self.position < len(self.source) and self.source[self.position] != ':' and self.source[
-            self.position] != '\n':
-            self._advance()
-
-        if self.position < len(self.source) and self.source[self.position] == ':':
-            self._advance()  # Include the colon
-
-        comp_def = self.source[start_pos:self.position].strip()
-        self.tokens.append(Token(TokenType.COMPONENT_DEF, comp_def, self.line, start_pos + 1))
-
-    def _is_component_use(self) -> bool:
-        # @ComponentName(...):
-        return self.position < len(self.source) and self.source[self.position] == '@' and self._peek(1) and self._peek(
-            1).isalpha()
-
-    def _tokenize_component_use(self) -> None:
-        start_pos = self.position
-
-        # Find the end of the component use
-        while self.position < len(self.source) and self.source[self.position] != '\n':
-            if self.source[self.position] == ':':
-                self._advance()  # Include the colon
+        source = self.source
+
+        # Jump from quote candidate to quote candidate with find instead
+        # of walking one character at a time
+        pos = start_pos + 1
+        while True:
+            idx = source.find(quote_char, pos)
+            if idx < 0:
+                raise SyntaxError(f"Unterminated string at line {self._line_of(start_pos)}")
+            # Count the backslash run before the quote: an even count
+            # means the backslashes escape each other, not the quote
+            j = idx - 1
+            while j > start_pos and source[j] == _BACKSLASH:
+                j -= 1
+            if (idx - 1 - j) % 2 == 0:
                 break
-            self._advance()
+            pos = idx + 1
 
-        comp_use = self.source[start_pos:self.position].strip()
-        self.tokens.append(Token(TokenType.COMPONENT_USE, comp_use, self.line, start_pos + 1))
+        string_value = source[start_pos:idx + 1].decode('utf-8')
+        self.tokens.append(TokenType.STRING, string_value, start_pos)
+        self.position = idx + 1
 
     def _tokenize_element_or_attribute(self) -> None:
+        source = self.source
+        n = len(source)
         start_pos = self.position
 
         # Read element name or attribute
-        while self.position < len(self.source) and (
-                self.source[self.position].isalnum() or self.source[self.position] in '_-'):
-            self._advance()
+        end = _scan_ident(source, start_pos)
+        self.position = end
 
         # Check what follows
         next_non_space = None
-        i = self.position
-        while i < len(self.source) and self.source[i].isspace() and self.source[i] != '\n':
-            i += 1
+        i = _scan_line_space(source, end)
 
-        if i < len(self.source):
-            next_non_space = self.source[i]
+        if i < n:
+            next_non_space = source[i]
 
-        element_name = self.source[start_pos:self.position]
+        element_name = source[start_pos:end].decode('utf-8')
 
         # If followed by a colon or space, it's an element
-        if next_non_space == ':' or (next_non_space and next_non_space != '\n' and next_non_space != '#'):
-            self.tokens.append(Token(TokenType.ELEMENT, element_name, self.line, start_pos + 1))
-
-            # Process attributes
-            if next_non_space != ':':
-                attr_start = self.position
-                while self.position < len(self.source) and self.source[self.position] != ':' and self.source[
-                    self.position] != '\n':
-                    self._advance()
-
-                attributes = self.source[attr_start:self.position].strip()
+        if next_non_space == _COLON or (next_non_space and next_non_space != _NEWLINE and next_non_space != _HASH):
+            self.tokens.append(TokenType.ELEMENT, element_name, start_pos)
+
+            # Process attributes: the run ends at the next ':' or '\n',
+            # located with two finds instead of a per-byte loop
+            if next_non_space != _COLON:
+                attr_start = end
+                nl = source.find(b'\n', attr_start)
+                if nl < 0:
+                    nl = n
+                colon = source.find(b':', attr_start, nl)
+                attr_end = colon if colon >= 0 else nl
+                self.position = attr_end
+
+                attributes = source[attr_start:attr_end].decode('utf-8').strip()
                 if attributes:
-                    self.tokens.append(Token(TokenType.ATTRIBUTE, attributes, self.line, attr_start + 1))
+                    self.tokens.append(TokenType.ATTRIBUTE, attributes, attr_start)
         else:
             # Otherwise, treat as content
-            self.tokens.append(Token(TokenType.CONTENT, element_name, self.line, start_pos + 1))
-
-    def _check_keyword_boundary(self, keyword_length: int) -> bool:
-        """Check if the keyword is properly separated from other code."""
-        after_pos = self.position + keyword_length
-        if after_pos >= len(self.source):
-            return True
-        return not (self.source[after_pos].isalnum() or self.source[after_pos] == '_')
\ No newline at end of file
+            self.tokens.append(TokenType.CONTENT, element_name, start_pos)
\ No newline at end of file
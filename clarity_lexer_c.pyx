@@ -0,0 +1,33 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled byte scanners for the Clarity lexer.
+
+These mirror _scan_ident/_scan_line_space in clarity_lexer.py as typed
+C loops. The pure-Python module imports them when the extension has
+been built and silently falls back otherwise, so building this file is
+optional.
+"""
+
+
+def scan_ident(const unsigned char[::1] buf, Py_ssize_t pos):
+    """Return the position just past an identifier run starting at pos."""
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef unsigned char b
+    while pos < n:
+        b = buf[pos]
+        if not (0x30 <= b <= 0x39 or 0x41 <= b <= 0x5A or 0x61 <= b <= 0x7A
+                or b == 0x5F or b == 0x2D or b >= 0x80):  # 0-9 A-Z a-z _ - non-ASCII
+            break
+        pos += 1
+    return pos
+
+
+def scan_line_space(const unsigned char[::1] buf, Py_ssize_t pos):
+    """Return the position just past any non-newline whitespace at pos."""
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef unsigned char b
+    while pos < n:
+        b = buf[pos]
+        if b != 0x20 and not (0x09 <= b <= 0x0D and b != 0x0A):  # space, tab, \r, \v, \f
+            break
+        pos += 1
+    return pos
@@ -1,12 +1,41 @@
 from typing import List, Dict, Any, Optional, Union, Tuple
-from clarity_lexer import Lexer, Token, TokenType
-from clarity_ast import *
+from clarity_lexer import Lexer, Token, TokenStream, TokenType
+from clarity_ast import (
+    ASTNode, Document, Element, TextContent, VariableDeclaration,
+    ForLoop, Conditional, ComponentDefinition, ComponentUse)
 import re
 
+# Statement patterns, compiled once. re.match() with a literal pattern
+# re-checks the module cache (under a lock) on every call; these fire
+# once per AST node, so resolve the compiled objects up front.
+_VAR_DECL_RE = re.compile(r'\$([\w_]+)\s*=\s*(.*)')
+_FOR_RE = re.compile(r'for\s+(\w+)\s+in\s+(.+)')
+_IF_RE = re.compile(r'if\s+(.+)')
+_COMP_DEF_RE = re.compile(r'@component\s+(\w+)\s*\(([^)]*)\)\s*')
+_COMP_USE_RE = re.compile(r'@(\w+)(?:\s*\(([^)]*)\))?')
+
+# One attribute per match: a name, optionally followed by =value where
+# the value is quoted (either style, backslash escapes allowed) or bare
+_ATTR_RE = re.compile(r'([\w-]+)(?:=("(?:\\.|[^"])*"|\'(?:\\.|[^\'])*\'|\S+))?')
+
+# Variable references inside attribute values
+_VARSUB_RE = re.compile(r'\$\w+')
+
+
+def _dequote(s: str) -> str:
+    """Strip one level of matching surrounding quotes, if present."""
+    if len(s) >= 2 and s[0] in '"\'' and s[-1] == s[0]:
+        return s[1:-1]
+    return s
+
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: TokenStream):
         self.tokens = tokens
+        # Direct references to the parallel token arrays; type checks are
+        # a list index plus int compare with no Token object in between
+        self.types = tokens.types
+        self.values = tokens.values
         self.position = 0
         self.variables: Dict[str, Any] = {}
         self.components: Dict[str, ComponentDefinition] = {}
@@ -15,54 +44,58 @@ class Parser:
         """Parse tokens into an AST"""
         document = Document(children=[])
 
-        while not self._is_at_end() and self._peek().type != TokenType.EOF:
+        # Hoist the loop state into locals; the loop condition then runs
+        # on LOAD_FAST instead of repeated attribute lookups
+        children = document.children
+        types = self.types
+        ntok = len(types)
+        eof = TokenType.EOF
+
+        while self.position < ntok and types[self.position] != eof:
             node = self._parse_statement()
             if node:
-                document.children.append(node)
+                children.append(node)
 
         return document
 
     def _parse_statement(self) -> Optional[ASTNode]:
         """Parse a top-level statement"""
-        token = self._peek()
+        token_type = self.types[self.position]
 
-        if token.type == TokenType.VARIABLE_DECL:
+        if token_type == TokenType.VARIABLE_DECL:
             return self._parse_variable_declaration()
-        elif token.type == TokenType.COMPONENT_DEF:
+        elif token_type == TokenType.COMPONENT_DEF:
             return self._parse_component_definition()
-        elif token.type == TokenType.ELEMENT:
+        elif token_type == TokenType.ELEMENT:
             return self._parse_element()
-        elif token.type == TokenType.FOR_LOOP:
+        elif token_type == TokenType.FOR_LOOP:
             return self._parse_for_loop()
-        elif token.type == TokenType.IF_STATEMENT:
+        elif token_type == TokenType.IF_STATEMENT:
             return self._parse_conditional()
-        elif token.type == TokenType.COMPONENT_USE:
+        elif token_type == TokenType.COMPONENT_USE:
             return self._parse_component_use()
-        elif token.type in (TokenType.NEWLINE, TokenType.COMMENT):
+        elif token_type in (TokenType.NEWLINE, TokenType.COMMENT):
             self._advance()  # Skip newlines and comments
             return None
-        elif token.type == TokenType.MULTILINE_STRING:
+        elif token_type == TokenType.MULTILINE_STRING:
             return self._parse_multiline_string()
         else:
-            self._error(f"Unexpected token: {token}")
+            self._error(f"Unexpected token: {self.tokens.token(self.position)}")
             self._advance()  # Skip the unexpected token
             return None
 
     def _parse_variable_declaration(self) -> VariableDeclaration:
         """Parse a variable declaration statement"""
-        token = self._consume(TokenType.VARIABLE_DECL)
-        match = re.match(r'\$([\w_]+)\s*=\s*(.*)', token.value)
+        decl = self._consume(TokenType.VARIABLE_DECL)
+        match = _VAR_DECL_RE.match(decl)
 
         if not match:
-            self._error(f"Invalid variable declaration: {token.value}")
+            self._error(f"Invalid variable declaration: {decl}")
             return VariableDeclaration("error", "")
 
         var_name = match.group(1)
-        var_value = match.group(2).strip()
-
         # Handle string literals
-        if var_value.startswith('"') and var_value.endswith('"'):
-            var_value = var_value[1:-1]
+        var_value = _dequote(match.group(2).strip())
 
         # Store variable for later use
         self.variables[f"${var_name}"] = var_value
@@ -71,18 +104,15 @@ class Parser:
 
     def _parse_multiline_string(self) -> TextContent:
         """Parse a multiline string"""
-        token = self._consume(TokenType.MULTILINE_STRING)
-        return TextContent(token.value)
+        return TextContent(self._consume(TokenType.MULTILINE_STRING))
 
     def _parse_element(self) -> Element:
         """Parse an HTML element"""
-        element_token = self._consume(TokenType.ELEMENT)
-        element_name = element_token.value
+        element_name = self._consume(TokenType.ELEMENT)
 
         attributes = {}
         if self._check(TokenType.ATTRIBUTE):
-            attr_token = self._consume(TokenType.ATTRIBUTE)
-            attributes = self._parse_attributes(attr_token.value)
+            attributes = self._parse_attributes(self._consume(TokenType.ATTRIBUTE))
 
         # Expect a colon
         self._consume(TokenType.COLON)
@@ -91,8 +121,9 @@ class Parser:
         content = None
         children = []
 
-        if self._check(TokenType.STRING) or self._check(TokenType.VARIABLE_REF) or self._check(
-                TokenType.CONTENT) or self._check(TokenType.MULTILINE_STRING):
+        token_type = self.types[self.position]
+        if token_type in (TokenType.STRING, TokenType.VARIABLE_REF,
+                          TokenType.CONTENT, TokenType.MULTILINE_STRING):
             content = self._parse_content()
         else:
             # Check for block content (indented children)
@@ -108,85 +139,61 @@ class Parser:
 
     def _parse_attributes(self, attr_str: str) -> Dict[str, Any]:
         """Parse element attributes"""
-        attributes = {}
+        attributes: Dict[str, Any] = {}
 
-        # Very simple attribute parsing (doesn't handle all edge cases)
-        in_quotes = False
-        quote_char = None
-        current_attr = ""
-        attr_parts = []
-
-        for char in attr_str:
-            if char in ['"', "'"]:
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-
-            current_attr += char
-
-            if char == ' ' and not in_quotes:
-                if current_attr.strip():
-                    attr_parts.append(current_attr.strip())
-                current_attr = ""
-
-        if current_attr.strip():
-            attr_parts.append(current_attr.strip())
-
-        # Process each attribute
-        for attr in attr_parts:
-            if '=' in attr:
-                key, value = attr.split('=', 1)
-                key = key.strip()
-
-                # Strip quotes from value if present
-                value = value.strip()
-                if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-                    value = value[1:-1]
-
-                # Replace variable references
-                for var_name, var_value in self.variables.items():
-                    if var_name in value:
-                        value = value.replace(var_name, var_value)
-
-                attributes[key] = value
-            else:
+        # One pass of the compiled pattern splits the string into
+        # name/value pairs, quoting included; no per-character state
+        # machine in Python
+        for match in _ATTR_RE.finditer(attr_str):
+            key, value = match.group(1, 2)
+
+            if value is None:
                 # Boolean attribute
-                attributes[attr.strip()] = True
+                attributes[key] = True
+                continue
+
+            # Strip quotes from value if present
+            value = _dequote(value)
+
+            # Replace variable references in one pass; unknown names are
+            # left as-is
+            if '$' in value:
+                value = _VARSUB_RE.sub(
+                    lambda m: self.variables.get(m.group(), m.group()), value)
+
+            attributes[key] = value
 
         return attributes
 
     def _parse_content(self) -> str:
         """Parse inline content"""
         if self._check(TokenType.STRING):
-            token = self._consume(TokenType.STRING)
             # Remove quotes
-            content = token.value
-            if content.startswith('"') and content.endswith('"'):
-                content = content[1:-1]
-            return content
+            return _dequote(self._consume(TokenType.STRING))
         elif self._check(TokenType.MULTILINE_STRING):
-            token = self._consume(TokenType.MULTILINE_STRING)
-            return token.value
+            return self._consume(TokenType.MULTILINE_STRING)
         elif self._check(TokenType.VARIABLE_REF):
-            token = self._consume(TokenType.VARIABLE_REF)
-            var_name = token.value
+            var_name = self._consume(TokenType.VARIABLE_REF)
             if var_name in self.variables:
                 return self.variables[var_name]
             return f"{var_name}"
         elif self._check(TokenType.CONTENT):
-            token = self._consume(TokenType.CONTENT)
-            return token.value
+            return self._consume(TokenType.CONTENT)
 
         return ""
 
     def _parse_block(self) -> List[ASTNode]:
         """Parse a block of statements (after an indentation)"""
         statements = []
-
-        while not self._is_at_end() and not self._check(TokenType.DEDENT):
+        types = self.types
+        ntok = len(types)
+        eof = TokenType.EOF
+        dedent = TokenType.DEDENT
+
+        while self.position < ntok:
+            token_type = types[self.position]
+            if token_type == eof or token_type == dedent:
+                break
             statement = self._parse_statement()
             if statement:
                 statements.append(statement)
@@ -195,12 +202,12 @@ class Parser:
 
     def _parse_for_loop(self) -> ForLoop:
         """Parse a for loop statement"""
-        for_token = self._consume(TokenType.FOR_LOOP)
+        for_stmt = self._consume(TokenType.FOR_LOOP)
 
         # Extract iterator and iterable from the for statement
-        match = re.match(r'for\s+(\w+)\s+in\s+(.+)', for_token.value)
+        match = _FOR_RE.match(for_stmt)
         if not match:
-            self._error(f"Invalid for loop syntax: {for_token.value}")
+            self._error(f"Invalid for loop syntax: {for_stmt}")
             return ForLoop("error", "error", [])
 
         iterator = match.group(1)
@@ -219,12 +226,12 @@ class Parser:
 
     def _parse_conditional(self) -> Conditional:
         """Parse an if/else conditional statement"""
-        if_token = self._consume(TokenType.IF_STATEMENT)
+        if_stmt = self._consume(TokenType.IF_STATEMENT)
 
         # Extract condition from the if statement
-        match = re.match(r'if\s+(.+)', if_token.value)
+        match = _IF_RE.match(if_stmt)
         if not match:
-            self._error(f"Invalid if statement syntax: {if_token.value}")
+            self._error(f"Invalid if statement syntax: {if_stmt}")
             return Conditional("True", [])
 
         condition = match.group(1)
@@ -253,12 +260,12 @@ class Parser:
 
     def _parse_component_definition(self) -> ComponentDefinition:
         """Parse a component definition"""
-        comp_token = self._consume(TokenType.COMPONENT_DEF)
+        comp_def = self._consume(TokenType.COMPONENT_DEF)
 
         # Extract component name and parameters
-        match = re.match(r'@component\s+(\w+)\s*\(([^)]*)\)\s*', comp_token.value)
+        match = _COMP_DEF_RE.match(comp_def)
         if not match:
-            self._error(f"Invalid component definition: {comp_token.value}")
+            self._error(f"Invalid component definition: {comp_def}")
             return ComponentDefinition("error", [], {}, [])
 
         name = match.group(1)
@@ -274,12 +281,8 @@ class Parser:
                 if '=' in param:
                     param_name, default = param.split('=', 1)
                     param_name = param_name.strip()
-                    default = default.strip()
-
                     # Process default value
-                    if (default.startswith('"') and default.endswith('"')) or \
-                            (default.startswith("'") and default.endswith("'")):
-                        default = default[1:-1]  # Remove quotes
+                    default = _dequote(default.strip())
 
                     parameters.append(param_name)
                     default_values[param_name] = default
@@ -287,7 +290,7 @@ class Parser:
                     parameters.append(param)
 
         # Expect a colon
-        if not comp_token.value.endswith(':'):
+        if not comp_def.endswith(':'):
             self._consume(TokenType.COLON)
 
         # Parse the component body
@@ -304,12 +307,12 @@ class Parser:
 
     def _parse_component_use(self) -> ComponentUse:
         """Parse a component use statement"""
-        comp_token = self._consume(TokenType.COMPONENT_USE)
+        comp_use = self._consume(TokenType.COMPONENT_USE)
 
         # Extract component name and arguments
-        match = re.match(r'@(\w+)(?:\s*\(([^)]*)\))?', comp_token.value)
+        match = _COMP_USE_RE.match(comp_use)
         if not match:
-            self._error(f"Invalid component use: {comp_token.value}")
+            self._error(f"Invalid component use: {comp_use}")
             return ComponentUse("error", {})
 
         name = match.group(1)
@@ -324,12 +327,8 @@ class Parser:
                 if '=' in arg:
                     arg_name, value = arg.split('=', 1)
                     arg_name = arg_name.strip()
-                    value = value.strip()
-
                     # Process value
-                    if (value.startswith('"') and value.endswith('"')) or \
-                            (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]  # Remove quotes
+                    value = _dequote(value.strip())
 
                     arguments[arg_name] = value
                 else:
@@ -338,34 +337,30 @@ class Parser:
 
         return ComponentUse(name, arguments)
 
-    def _consume(self, expected_type: TokenType) -> Token:
-        """Consume and return the current token if it matches the expected type"""
-        if self._check(expected_type):
-            return self._advance()
+    def _consume(self, expected_type: TokenType) -> str:
+        """Consume the current token and return its value if it matches the expected type"""
+        position = self.position
+        if position < len(self.types) and self.types[position] == expected_type.value:
+            self.position = position + 1
+            return self.values[position]
 
-        token = self._peek()
+        token = self.tokens.token(position)
         self._error(f"Expected {expected_type} but got {token.type} at line {token.line}")
-        return token
+        return token.value
 
     def _check(self, type: TokenType) -> bool:
         """Check if the current token is of the given type"""
-        if self._is_at_end():
-            return False
-        return self._peek().type == type
+        position = self.position
+        return position < len(self.types) and self.types[position] == type.value
 
-    def _advance(self) -> Token:
-        """Advance to the next token and return the previous one"""
+    def _advance(self) -> None:
+        """Advance past the current token"""
         if not self._is_at_end():
             self.position += 1
-        return self.tokens[self.position - 1]
-
-    def _peek(self) -> Token:
-        """Return the current token without consuming it"""
-        return self.tokens[self.position]
 
     def _is_at_end(self) -> bool:
         """Check if we've reached the end of tokens"""
-        return self.position >= len(self.tokens) or self._peek().type == TokenType.EOF
+        return self.position >= len(self.types) or self.types[self.position] == TokenType.EOF
 
     def _error(self, message: str) -> None:
         """Report an error"""
@@ -0,0 +1,30 @@
+from setuptools import setup
+
+# Compile the whole pipeline — lexer, parser and compiler — with mypyc
+# when it is available; without it the pure-Python modules are installed
+# unchanged.
+ext_modules = []
+try:
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['clarity_lexer.py', 'clarity_parser.py',
+                            'clarity_compiler.py'])
+except ImportError:
+    pass
+
+# Build the lexer's byte scanners as a C extension when Cython is
+# available; clarity_lexer falls back to its regex scanners otherwise.
+try:
+    from Cython.Build import cythonize
+    ext_modules += cythonize(['clarity_lexer_c.pyx'])
+except ImportError:
+    pass
+
+setup(
+    name='clarity-language',
+    version='0.1',
+    description='Clarity: HTML with the readability of Python',
+    py_modules=['clarity', 'clarity_ast', 'clarity_lexer',
+                'clarity_parser', 'clarity_compiler'],
+    ext_modules=ext_modules,
+    python_requires='>=3.10',
+)